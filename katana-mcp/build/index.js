@@ -2,6 +2,22 @@ import { createToolServer, z, ToolRunContext } from "@modelcontextprotocol/sdk";
 import { spawn } from "child_process";
 
 const KATANA_BIN = "katana";                       // assumes binary in $PATH
+const CACHE_TTL_MS = cacheTtlMs(process.env.KATANA_CACHE_TTL_MS);  // 0 disables the cache
+const CACHE_MAX_BYTES = 64 * 1024 * 1024;         // total crawl output kept in memory
+// flags that make katana write files; a cache hit would skip those writes
+const SIDE_EFFECT_FLAGS = new Set([
+  "o", "output", "sr", "store-response", "srd", "store-response-dir", "sf", "store-field"
+]);
+
+// ---------- Config ----------
+function cacheTtlMs(raw: string | undefined): number {
+  if (raw === undefined || raw.trim() === "") return 60 * 1000;
+  const ttl = Number(raw);
+  if (!Number.isFinite(ttl) || ttl < 0) {
+    throw new Error(`KATANA_CACHE_TTL_MS must be a non-negative number of milliseconds, got '${raw}'`);
+  }
+  return ttl;
+}
 
 // ---------- Schema ----------
 const schema = z.object({
@@ -9,14 +25,65 @@ const schema = z.object({
     .string()
     .describe(
       "Command-line flags to forward to Katana (e.g. '-u https://example.com -jc'). " +
-      "Leave empty for a default quick crawl."
+      "Leave empty for a default quick crawl." +
+      (CACHE_TTL_MS > 0
+        ? ` Identical args reuse the previous result for ${CACHE_TTL_MS / 1000} s ` +
+          "(set KATANA_CACHE_TTL_MS=0 to always re-crawl)."
+        : "")
     )
 });
 
+// ---------- Cache ----------
+// keyed by argv; the pending promise is stored so concurrent identical calls share one crawl.
+// Map iteration follows insertion order, so the first entries are the oldest.
+type CacheEntry = { output: Promise<Buffer>; bytes: number };
+const cache = new Map<string, CacheEntry>();
+let cacheBytes = 0;
+
+function evict(key: string, entry: CacheEntry): void {
+  if (cache.get(key) !== entry) return;          // already replaced or evicted
+  cache.delete(key);
+  cacheBytes -= entry.bytes;
+}
+
+function hasSideEffects(argList: string[]): boolean {
+  return argList.some(
+    (a) => a.startsWith("-") && SIDE_EFFECT_FLAGS.has(a.replace(/^-+/, "").split("=")[0])
+  );
+}
+
 // ---------- Helper ----------
-async function runKatana(cliArgs: string): Promise<Buffer> {
+// cache hits are decided synchronously so the caller can log before awaiting the crawl
+function runKatana(cliArgs: string): { output: Promise<Buffer>; cached: boolean } {
   const argList =
     cliArgs.trim().length > 0 ? cliArgs.trim().split(/\s+/) : ["-u", "https://example.com"];
+  if (CACHE_TTL_MS === 0 || hasSideEffects(argList)) {
+    return { output: spawnKatana(argList), cached: false };
+  }
+
+  const key = argList.join("\0");
+  const hit = cache.get(key);
+  if (hit) return { output: hit.output, cached: true };
+
+  const entry: CacheEntry = { output: spawnKatana(argList), bytes: 0 };
+  cache.set(key, entry);
+  entry.output.then(
+    (buf) => {
+      if (cache.get(key) !== entry) return;
+      entry.bytes = buf.length;
+      cacheBytes += buf.length;
+      setTimeout(() => evict(key, entry), CACHE_TTL_MS).unref();
+      for (const [k, e] of cache) {
+        if (cacheBytes <= CACHE_MAX_BYTES) break;
+        evict(k, e);
+      }
+    },
+    () => evict(key, entry)
+  );
+  return { output: entry.output, cached: false };
+}
+
+function spawnKatana(argList: string[]): Promise<Buffer> {
   return new Promise((resolve, reject) => {
     const proc = spawn(KATANA_BIN, argList, { stdio: ["ignore", "pipe", "inherit"] });
     const chunks: Buffer[] = [];
@@ -37,8 +104,10 @@ createToolServer({
   schema,
 
   async run({ input, logger }: ToolRunContext<typeof schema>) {
-    logger.info(`Running Katana with: ${input.args || "(default args)"}`);
-    const output = await runKatana(input.args);
-    return { contentType: "text/plain", data: output };
+    const { output, cached } = runKatana(input.args);
+    logger.info(
+      `${cached ? "Reusing cached Katana crawl" : "Running Katana"} with: ${input.args || "(default args)"}`
+    );
+    return { contentType: "text/plain", data: await output };
   }
 });
@@ -4,8 +4,13 @@ red_team_mcp_server.py
 A super-server that imports every tool from the individual pentest tools
 """
 
-import asyncio
-from fastmcp import FastMCP, Client  
+import anyio
+from fastmcp import FastMCP, Client
+
+try:
+    import uvloop                            # optional, faster event loop
+except ImportError:
+    uvloop = None
 
 red_team = FastMCP(
     name="red_team",
@@ -14,10 +19,12 @@ red_team = FastMCP(
 
 async def setup() -> None:
     # nmap mcp server
-    nmap_client = Client("nmap.py")          
+    nmap_client = Client("nmap.py")
     nmap_proxy = FastMCP.from_client(nmap_client, name="nmap_proxy")
     await red_team.import_server("nmap", nmap_proxy)
 
 if __name__ == "__main__":
-    asyncio.run(setup())
-    red_team.run()       
+    # anyio builds the loop with uvloop.new_event_loop, no event loop policy involved
+    backend_options = {"use_uvloop": True} if uvloop is not None else {}
+    anyio.run(setup, backend_options=backend_options)
+    anyio.run(red_team.run_async, backend_options=backend_options)